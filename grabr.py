@@ -3,16 +3,24 @@ import os
 import sys
 import logging
 import argparse
-import requests
+import json
+import asyncio
+import httpx
 from bs4 import BeautifulSoup
+from bs4.dammit import UnicodeDammit
 from urllib.parse import urljoin, urlparse
 from tqdm import tqdm
-import mimetypes
-import hashlib
-from datetime import datetime
 import re
+import shutil
+import socket
+import time
 import unicodedata
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Fall back to BeautifulSoup parsing
+    LexborHTMLParser = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,13 +30,87 @@ logging.basicConfig(
         logging.StreamHandler(sys.stdout)
     ]
 )
+# httpx logs every request at INFO, which floods the log and the progress bar
+logging.getLogger('httpx').setLevel(logging.WARNING)
+logging.getLogger('httpcore').setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Default number of concurrent image download workers
+TASKS_COUNT = 10
+# Connection pool limits shared by the sync and async HTTP/2 clients
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=128)
+# Server errors that are retried, and how often, with exponential backoff
+RETRY_STATUSES = (500, 502, 503, 504)
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+# Size of each read when streaming image bodies to disk
+CHUNK_SIZE = 262144
+# Buffer size for image files so several chunks are coalesced per write
+WRITE_BUFFER_SIZE = 1048576
+# Smallest image that gets its own progress bar in single downloads
+PROGRESS_MIN_SIZE = 1 << 20
+
+# Raster image extensions accepted from img src and srcset attributes
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+# File extensions for downloaded image content types
+_MIME_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/webp': '.webp',
+    'image/gif': '.gif',
+    'image/avif': '.avif',
+    'image/svg+xml': '.svg'
+}
+
+# Turkish character mappings used by slugify
+_TR_TABLE = str.maketrans({
+    'ı': 'i', 'İ': 'i', 'ğ': 'g', 'Ğ': 'g',
+    'ü': 'u', 'Ü': 'u', 'ş': 's', 'Ş': 's',
+    'ö': 'o', 'Ö': 'o', 'ç': 'c', 'Ç': 'c'
+})
+_SLUG_DROP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+
+# Seconds to reuse resolved addresses for repeated image hosts
+DNS_CACHE_TTL = 300
+_dns_cache = {}
+_original_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo replacement that caches results for DNS_CACHE_TTL seconds."""
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    cached = _dns_cache.get(key)
+    if cached and now - cached[0] < DNS_CACHE_TTL:
+        return cached[1]
+
+    result = _original_getaddrinfo(host, port, family, type, proto, flags)
+    _dns_cache[key] = (now, result)
+    return result
+
+def install_dns_cache():
+    """Route all name lookups through the in-process DNS cache."""
+    socket.getaddrinfo = _cached_getaddrinfo
+
 class MenuGrabber:
-    def __init__(self, url=None, output_dir='./menu_items'):
+    def __init__(self, url=None, output_dir='./menu_items', workers=TASKS_COUNT, parser=None):
         self.url = url
         self.output_dir = output_dir
-        self.session = requests.Session()
+        # At least one worker, otherwise the download queue never drains
+        self.workers = max(1, workers)
+        # Charset declared by the last fetched page, if any
+        self.page_encoding = None
+        # Prefer selectolax when available, BeautifulSoup otherwise
+        self.parser = parser or ('selectolax' if LexborHTMLParser is not None else 'bs4')
+        if self.parser == 'selectolax' and LexborHTMLParser is None:
+            raise ValueError("selectolax is not installed, use parser='bs4'")
+        install_dns_cache()
+        # Multiplex the page fetch and image downloads over HTTP/2 where
+        # supported, keeping connections alive and retrying failed connects
+        self.session = httpx.Client(
+            transport=httpx.HTTPTransport(http2=True, limits=HTTP_LIMITS, retries=3),
+            follow_redirects=True
+        )
         # Set a user agent to avoid being blocked by some websites
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -36,123 +118,236 @@ class MenuGrabber:
 
     def slugify(self, value):
         """Convert a string to a URL and file system friendly slug."""
-        # Turkish character mappings
-        tr_map = {
-            'ı': 'i', 'İ': 'i', 'ğ': 'g', 'Ğ': 'g',
-            'ü': 'u', 'Ü': 'u', 'ş': 's', 'Ş': 's',
-            'ö': 'o', 'Ö': 'o', 'ç': 'c', 'Ç': 'c'
-        }
-        
         # Replace Turkish characters
-        for k, v in tr_map.items():
-            value = value.replace(k, v)
-            
+        value = value.translate(_TR_TABLE)
+
         # Then normalize
         value = unicodedata.normalize('NFKD', value)
         value = value.encode('ascii', 'ignore').decode('ascii')
-        value = re.sub(r'[^\w\s-]', '', value).strip().lower()
-        return re.sub(r'[-\s]+', '-', value)
+        value = _SLUG_DROP.sub('', value).strip().lower()
+        return _SLUG_DASH.sub('-', value)
+
+    def _send(self, method, url, stream=False, **kwargs):
+        """Send a request, retrying RETRY_STATUSES responses with backoff."""
+        request = self.session.build_request(method, url, **kwargs)
+        for attempt in range(RETRY_TOTAL + 1):
+            response = self.session.send(request, stream=stream)
+            if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                return response
+            response.close()
+            logger.warning(f"Got {response.status_code} for {method} {url}, retrying...")
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+    async def _send_async(self, client, method, url, stream=False, **kwargs):
+        """Async variant of _send for an httpx.AsyncClient."""
+        request = client.build_request(method, url, **kwargs)
+        for attempt in range(RETRY_TOTAL + 1):
+            response = await client.send(request, stream=stream)
+            if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                return response
+            await response.aclose()
+            logger.warning(f"Got {response.status_code} for {method} {url}, retrying...")
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
 
     def fetch_page(self, url=None):
-        """Fetch the HTML content of the webpage."""
+        """Fetch the raw HTML bytes of the webpage.
+
+        Decoding is left to the parser; the charset from the Content-Type
+        header, if any, is kept in self.page_encoding.
+        """
         try:
             target_url = url or self.url
             if not target_url:
                 raise ValueError("URL is required")
 
-            response = self.session.get(target_url)
+            response = self._send('GET', target_url)
             response.raise_for_status()
-            return response.text
-        except requests.exceptions.RequestException as e:
+            self.page_encoding = response.charset_encoding
+            return response.content
+        except httpx.HTTPError as e:
             logger.error(f"Error fetching page: {str(e)}")
             raise
 
-    def parse_menu_items(self, html_content):
-        """Extract menu items with their details."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+    @staticmethod
+    def _is_image_src(src):
+        """Check whether an img src/srcset entry points to a usable raster image."""
+        return bool(src) and not src.startswith('data:') and not 'svg' in src.lower()
+
+    @staticmethod
+    def _has_image_extension(src):
+        """Check whether a URL ends with a known raster image extension."""
+        return src.lower().endswith(IMAGE_EXTENSIONS)
+
+    def _image_from_srcset(self, srcset):
+        """Pick the first valid image URL from a srcset attribute."""
+        # Lazily walk the srcset URLs and stop at the first valid one
+        candidates = (url.strip().split(' ', 1)[0] for url in srcset.split(','))
+        return next((url for url in candidates
+                     if self._is_image_src(url) and self._has_image_extension(url)), None)
+
+    def _extract_item_bs4(self, grid):
+        """Extract (title, description, image URL) from a BeautifulSoup grid item."""
+        # Each menu item has two columns: image (col-4) and content (col-8)
+        image_col = grid.find('div', class_='ghostkit-col-4')
+        content_col = grid.find('div', class_='ghostkit-col-8')
+
+        if not (image_col and content_col):
+            logger.info("Missing image or content column, skipping...")
+            return None
+
+        # Get title from h2
+        title_elem = content_col.find(['h2', 'h1', 'h3', 'h4', 'h5', 'h6'])
+        if not title_elem:
+            logger.info("No title found, skipping...")
+            return None
+
+        title = title_elem.get_text(strip=True)
+        logger.info(f"Found title: {title}")
+
+        # Get description from p tag
+        desc_elem = content_col.find('p')
+        description = desc_elem.get_text(strip=True) if desc_elem else ""
+        logger.info(f"Found description: {description}")
+
+        # Get image URL - try multiple approaches
+        img_url = None
+
+        # First try: Find img tag with wp-image class
+        img = image_col.find('img', class_=lambda x: x and 'wp-image-' in x)
+        if img:
+            # Try data-src first
+            src = img.get('data-src', '')
+            if not src:
+                src = img.get('src', '')
+
+            if self._is_image_src(src):
+                img_url = src
+                logger.info(f"Found image URL from wp-image: {img_url}")
+
+        # Second try: Find picture element and get source
+        if not img_url:
+            picture = image_col.find('picture')
+            if picture:
+                source = picture.find('source')
+                if source:
+                    # Try data-srcset first
+                    srcset = source.get('data-srcset', '')
+                    if not srcset:
+                        srcset = source.get('srcset', '')
+
+                    if srcset:
+                        img_url = self._image_from_srcset(srcset)
+                        if img_url:
+                            logger.info(f"Found image URL from picture source: {img_url}")
+
+        # Third try: Find any img tag with data-src
+        if not img_url:
+            for img in image_col.find_all('img'):
+                src = img.get('data-src', '')
+                if not src:
+                    src = img.get('src', '')
+
+                if self._is_image_src(src) and self._has_image_extension(src):
+                    img_url = src
+                    logger.info(f"Found image URL from generic img: {img_url}")
+                    break
+
+        return title, description, img_url
+
+    def _extract_item_selectolax(self, grid):
+        """Extract (title, description, image URL) from a selectolax grid node."""
+        # Each menu item has two columns: image (col-4) and content (col-8)
+        image_col = grid.css_first('div.ghostkit-col-4')
+        content_col = grid.css_first('div.ghostkit-col-8')
+
+        if not (image_col and content_col):
+            logger.info("Missing image or content column, skipping...")
+            return None
+
+        # Get title from the first heading
+        title_elem = content_col.css_first('h1, h2, h3, h4, h5, h6')
+        if not title_elem:
+            logger.info("No title found, skipping...")
+            return None
+
+        title = title_elem.text(strip=True)
+        logger.info(f"Found title: {title}")
+
+        # Get description from p tag
+        desc_elem = content_col.css_first('p')
+        description = desc_elem.text(strip=True) if desc_elem else ""
+        logger.info(f"Found description: {description}")
+
+        # Get image URL - try multiple approaches
+        img_url = None
+
+        # First try: Find img tag with wp-image class
+        img = image_col.css_first('img[class*="wp-image-"]')
+        if img:
+            src = img.attributes.get('data-src') or img.attributes.get('src') or ''
+            if self._is_image_src(src):
+                img_url = src
+                logger.info(f"Found image URL from wp-image: {img_url}")
+
+        # Second try: Find picture element and get source
+        if not img_url:
+            picture = image_col.css_first('picture')
+            source = picture.css_first('source') if picture else None
+            if source:
+                srcset = source.attributes.get('data-srcset') or source.attributes.get('srcset') or ''
+                if srcset:
+                    img_url = self._image_from_srcset(srcset)
+                    if img_url:
+                        logger.info(f"Found image URL from picture source: {img_url}")
+
+        # Third try: Find any img tag with data-src
+        if not img_url:
+            for img in image_col.css('img'):
+                src = img.attributes.get('data-src') or img.attributes.get('src') or ''
+                if self._is_image_src(src) and self._has_image_extension(src):
+                    img_url = src
+                    logger.info(f"Found image URL from generic img: {img_url}")
+                    break
+
+        return title, description, img_url
+
+    def parse_menu_items(self, html_content, encoding=None):
+        """Extract menu items with their details.
+
+        html_content may be str or bytes; for bytes, encoding is the
+        charset declared by the server, if known.
+        """
         menu_items = []
 
         logger.info("Searching for menu items...")
 
         # Find all GhostKit grid items
-        grid_items = soup.find_all('div', class_='ghostkit-grid-inner')
+        if self.parser == 'selectolax':
+            # Lexbor reads bytes as UTF-8, so decode up front the same way
+            # BeautifulSoup does: header charset, then <meta>, then sniffing
+            if isinstance(html_content, bytes):
+                dammit = UnicodeDammit(html_content, known_definite_encodings=[encoding] if encoding else [], is_html=True)
+                if dammit.unicode_markup is None:
+                    html_content = html_content.decode('utf-8', errors='replace')
+                else:
+                    html_content = dammit.unicode_markup
+            grid_items = LexborHTMLParser(html_content).css('div.ghostkit-grid-inner')
+            extract_item = self._extract_item_selectolax
+        else:
+            soup = BeautifulSoup(html_content, 'lxml', from_encoding=encoding)
+            grid_items = soup.select('div.ghostkit-grid-inner')
+            extract_item = self._extract_item_bs4
         logger.info(f"Found {len(grid_items)} grid items")
         
+        seen = set()
+        used_slugs = set()
+        duplicates = 0
         for grid in grid_items:
             try:
-                # Each menu item has two columns: image (col-4) and content (col-8)
-                image_col = grid.find('div', class_='ghostkit-col-4')
-                content_col = grid.find('div', class_='ghostkit-col-8')
-                
-                if not (image_col and content_col):
-                    logger.info("Missing image or content column, skipping...")
+                extracted = extract_item(grid)
+                if not extracted:
                     continue
-
-                # Get title from h2
-                title_elem = content_col.find(['h2', 'h1', 'h3', 'h4', 'h5', 'h6'])
-                if not title_elem:
-                    logger.info("No title found, skipping...")
-                    continue
-                
-                title = title_elem.get_text(strip=True)
-                logger.info(f"Found title: {title}")
-
-                # Get description from p tag
-                desc_elem = content_col.find('p')
-                description = desc_elem.get_text(strip=True) if desc_elem else ""
-                logger.info(f"Found description: {description}")
-
-                # Get image URL - try multiple approaches
-                img_url = None
-                
-                # First try: Find img tag with wp-image class
-                img = image_col.find('img', class_=lambda x: x and 'wp-image-' in x)
-                if img:
-                    # Try data-src first
-                    src = img.get('data-src', '')
-                    if not src:
-                        src = img.get('src', '')
-                    
-                    if src and not src.startswith('data:') and not 'svg' in src.lower():
-                        img_url = src
-                        logger.info(f"Found image URL from wp-image: {img_url}")
-                
-                # Second try: Find picture element and get source
-                if not img_url:
-                    picture = image_col.find('picture')
-                    if picture:
-                        source = picture.find('source')
-                        if source:
-                            # Try data-srcset first
-                            srcset = source.get('data-srcset', '')
-                            if not srcset:
-                                srcset = source.get('srcset', '')
-                            
-                            if srcset:
-                                # Get all URLs from srcset
-                                urls = [url.strip().split(' ')[0] for url in srcset.split(',')]
-                                # Filter valid image URLs
-                                valid_urls = [url for url in urls 
-                                            if not url.startswith('data:') 
-                                            and not 'svg' in url.lower()
-                                            and any(url.lower().endswith(ext) 
-                                                  for ext in ['.jpg','.jpeg','.png','.webp'])]
-                                if valid_urls:
-                                    img_url = valid_urls[0]
-                                    logger.info(f"Found image URL from picture source: {img_url}")
-                
-                # Third try: Find any img tag with data-src
-                if not img_url:
-                    for img in image_col.find_all('img'):
-                        src = img.get('data-src', '')
-                        if not src:
-                            src = img.get('src', '')
-                        
-                        if src and not src.startswith('data:') and not 'svg' in src.lower():
-                            if any(src.lower().endswith(ext) for ext in ['.jpg','.jpeg','.png','.webp']):
-                                img_url = src
-                                logger.info(f"Found image URL from generic img: {img_url}")
-                                break
+                title, description, img_url = extracted
 
                 # Make URL absolute if it's relative
                 if img_url:
@@ -160,11 +355,28 @@ class MenuGrabber:
                     logger.info(f"Final image URL: {img_url}")
 
                 if title and (description or img_url):
-                    menu_items.append({
+                    item = {
                         'title': title,
+                        'slug': self.slugify(title),
                         'description': description,
                         'image_url': img_url
-                    })
+                    }
+                    key = (title, description, img_url)
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(key)
+
+                    # Number repeated names (e.g. hot and iced "Latte") so
+                    # their folders and concurrent downloads never collide
+                    slug = item['slug']
+                    count = 1
+                    while item['slug'] in used_slugs:
+                        count += 1
+                        item['slug'] = f"{slug}-{count}"
+                    used_slugs.add(item['slug'])
+
+                    menu_items.append(item)
                     logger.info(f"Added menu item: {title} with image: {img_url}")
 
             except Exception as e:
@@ -176,45 +388,202 @@ class MenuGrabber:
             # Print sample HTML for debugging
             logger.info("Sample HTML structure:")
             if grid_items:
-                logger.info(grid_items[0].prettify())
+                sample = grid_items[0]
+                logger.info(sample.html if self.parser == 'selectolax' else sample.prettify())
         else:
+            if duplicates:
+                logger.info(f"Skipped {duplicates} duplicate menu items")
             logger.info(f"Successfully found {len(menu_items)} menu items")
 
+        # Free the BeautifulSoup tree now, its parent/child reference cycles
+        # would otherwise keep it alive until the garbage collector runs.
+        # Decomposing the root alone leaves its children intact.
+        if self.parser == 'bs4':
+            for element in soup.find_all(recursive=False):
+                element.decompose()
+
         return menu_items
 
-    def download_image(self, url, folder_path, title):
-        """Download an image for a menu item."""
+    def _load_meta(self, url, folder_path, slug):
+        """Return the cached metadata for url if its image is already on disk."""
+        meta_path = os.path.join(folder_path, f"{slug}.meta")
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        filepath = os.path.join(folder_path, meta.get('filename', ''))
+        if meta.get('url') != url or not os.path.isfile(filepath):
+            return None
+        # A truncated or replaced file must be downloaded again, so do not
+        # let it short-circuit the HEAD check or a conditional GET
+        if os.path.getsize(filepath) != meta.get('length'):
+            return None
+        return meta
+
+    def _save_meta(self, url, folder_path, slug, filename, headers):
+        """Store the validators of a downloaded image next to it."""
+        meta = {
+            'url': url,
+            'filename': filename,
+            'etag': headers.get('etag'),
+            'last_modified': headers.get('last-modified'),
+            'length': os.path.getsize(os.path.join(folder_path, filename))
+        }
+        meta_path = os.path.join(folder_path, f"{slug}.meta")
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    @staticmethod
+    def _conditional_headers(meta):
+        """Build If-None-Match/If-Modified-Since headers from cached metadata."""
+        headers = {}
+        if meta and meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta and meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    @staticmethod
+    def _is_image_response(headers):
+        """Check that a HEAD response does not advertise a non-image content type."""
+        content_type = headers.get('content-type')
+        return not content_type or content_type.startswith('image/')
+
+    @staticmethod
+    def _matches_meta(meta, folder_path, headers):
+        """Check whether HEAD response headers describe the image on disk."""
+        try:
+            length = int(headers['content-length'])
+        except (KeyError, ValueError):
+            return False
+        return length == os.path.getsize(os.path.join(folder_path, meta['filename']))
+
+    def _check_head(self, url, head, meta, folder_path):
+        """Decide from a HEAD response whether the GET can be skipped.
+
+        Returns (done, filename); when done is True, filename is the result
+        of the download. A failed or unsupported HEAD defers to the GET.
+        """
+        if head is None or not head.is_success:
+            return False, None
+        if not self._is_image_response(head.headers):
+            logger.warning(f"Skipping non-image content type: {head.headers['content-type']} for URL: {url}")
+            return True, None
+        # Skip images that are already on disk and unchanged
+        if meta and not self._conditional_headers(meta) and self._matches_meta(meta, folder_path, head.headers):
+            logger.info(f"Image unchanged, skipping: {meta['filename']}")
+            return True, meta['filename']
+        return False, None
+
+    def _target_for(self, url, response, meta, slug):
+        """Decide from a GET response whether and where to save the body.
+
+        Returns (done, filename) like _check_head; when done is False,
+        filename is the name to stream the body to.
+        """
+        if response.status_code == 304:
+            logger.info(f"Image unchanged, skipping: {meta['filename']}")
+            return True, meta['filename']
+        response.raise_for_status()
+
+        content_type = response.headers.get('content-type', '')
+        if not content_type.startswith('image/'):
+            logger.warning(f"Skipping non-image content type: {content_type} for URL: {url}")
+            return True, None
+
+        # Generate filename from slug and extension
+        ext = _MIME_EXTENSIONS.get(content_type.split(';', 1)[0].strip().lower(), '.jpg')
+        return False, f"{slug}{ext}"
+
+    def download_image(self, url, folder_path, slug, show_progress=True):
+        """Download an image for a menu item.
+
+        A per-file progress bar is only drawn for large files on a terminal,
+        and never when show_progress is False.
+        """
         try:
             if not url:
                 return None
 
-            response = self.session.get(url, stream=True)
-            response.raise_for_status()
-            
-            content_type = response.headers.get('content-type', '')
-            if not content_type.startswith('image/'):
-                logger.warning(f"Skipping non-image content type: {content_type} for URL: {url}")
-                return None
+            meta = self._load_meta(url, folder_path, slug)
 
-            # Generate filename from title and extension
-            ext = mimetypes.guess_extension(content_type) or '.jpg'
-            filename = f"{self.slugify(title)}{ext}"
-            filepath = os.path.join(folder_path, filename)
-
-            # Download with progress bar
-            total_size = int(response.headers.get('content-length', 0))
-            with open(filepath, 'wb') as f:
-                with tqdm(
-                    total=total_size,
-                    unit='B',
-                    unit_scale=True,
-                    desc=f"Downloading {filename}"
-                ) as pbar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
+            # Check the response with HEAD before paying for the body,
+            # falling back to the GET checks if HEAD is not supported
+            try:
+                head = self._send('HEAD', url)
+            except httpx.HTTPError as e:
+                logger.warning(f"HEAD request failed for {url}, trying GET: {e}")
+                head = None
+            done, filename = self._check_head(url, head, meta, folder_path)
+            if done:
+                return filename
+
+            response = self._send('GET', url, stream=True, headers=self._conditional_headers(meta))
+            try:
+                done, filename = self._target_for(url, response, meta, slug)
+                if done:
+                    return filename
+
+                # Download with progress bar
+                total_size = int(response.headers.get('content-length', 0))
+                use_bar = show_progress and total_size > PROGRESS_MIN_SIZE and sys.stderr.isatty()
+                with open(os.path.join(folder_path, filename), 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    with tqdm(
+                        total=total_size,
+                        unit='B',
+                        unit_scale=True,
+                        desc=f"Downloading {filename}",
+                        disable=not use_bar
+                    ) as pbar:
+                        for chunk in response.iter_bytes(chunk_size=CHUNK_SIZE):
                             f.write(chunk)
                             pbar.update(len(chunk))
 
+                self._save_meta(url, folder_path, slug, filename, response.headers)
+            finally:
+                response.close()
+            logger.info(f"Successfully downloaded: {filename}")
+            return filename
+
+        except Exception as e:
+            logger.error(f"Error downloading image {url}: {str(e)}")
+            return None
+
+    async def _download_image_async(self, client, url, folder_path, slug):
+        """Download an image for a menu item using an httpx.AsyncClient."""
+        try:
+            if not url:
+                return None
+
+            meta = self._load_meta(url, folder_path, slug)
+
+            # Check the response with HEAD before paying for the body,
+            # falling back to the GET checks if HEAD is not supported
+            try:
+                head = await self._send_async(client, 'HEAD', url)
+            except httpx.HTTPError as e:
+                logger.warning(f"HEAD request failed for {url}, trying GET: {e}")
+                head = None
+            done, filename = self._check_head(url, head, meta, folder_path)
+            if done:
+                return filename
+
+            response = await self._send_async(client, 'GET', url, stream=True, headers=self._conditional_headers(meta))
+            try:
+                done, filename = self._target_for(url, response, meta, slug)
+                if done:
+                    return filename
+
+                # Stream to disk, progress is reported per file by _download_all
+                with open(os.path.join(folder_path, filename), 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+
+                self._save_meta(url, folder_path, slug, filename, response.headers)
+            finally:
+                await response.aclose()
             logger.info(f"Successfully downloaded: {filename}")
             return filename
 
@@ -222,9 +591,70 @@ class MenuGrabber:
             logger.error(f"Error downloading image {url}: {str(e)}")
             return None
 
-    def save_menu_item(self, item, download_mode='all'):
-        """Save a menu item's details and image to its own folder."""
-        folder_name = self.slugify(item['title'])
+    async def _download_worker(self, client, queue, results, copies, pbar):
+        """Consume (index, url, folder_path, slug) jobs until cancelled."""
+        while True:
+            index, url, folder_path, slug = await queue.get()
+            try:
+                filename = await self._download_image_async(client, url, folder_path, slug)
+                results[index] = filename
+                # Copy to items sharing this URL before anything else can touch the file
+                if filename:
+                    for copy_folder, copy_slug in copies.get(url, ()):
+                        self._copy_image(folder_path, filename, copy_folder, copy_slug)
+            finally:
+                pbar.update(1)
+                queue.task_done()
+
+    async def _download_all(self, downloads, copies=None):
+        """Download (url, folder_path, slug) jobs concurrently, returning filenames in order.
+
+        copies maps an image URL to further (folder_path, slug) targets that
+        receive a copy of the file as soon as its download finishes.
+        """
+        copies = copies or {}
+        results = [None] * len(downloads)
+        if not downloads:
+            return results
+
+        queue = asyncio.Queue()
+        for index, (url, folder_path, slug) in enumerate(downloads):
+            queue.put_nowait((index, url, folder_path, slug))
+
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS, retries=3)
+        async with httpx.AsyncClient(transport=transport, headers=self.session.headers,
+                                     cookies=self.session.cookies, follow_redirects=True) as client:
+            with tqdm(total=len(downloads), unit='file', desc="Downloading images") as pbar:
+                workers = [
+                    asyncio.create_task(self._download_worker(client, queue, results, copies, pbar))
+                    for _ in range(min(self.workers, len(downloads)))
+                ]
+                await queue.join()
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+        return results
+
+    def _copy_image(self, source_folder, filename, folder_path, slug):
+        """Copy an already downloaded image into another menu item's folder."""
+        target = f"{slug}{os.path.splitext(filename)[1]}"
+        source_path = os.path.join(source_folder, filename)
+        target_path = os.path.join(folder_path, target)
+        if source_path != target_path:
+            try:
+                shutil.copyfile(source_path, target_path)
+                logger.info(f"Copied image {filename} to {target_path}")
+            except OSError as e:
+                logger.error(f"Error copying image {source_path} to {target_path}: {str(e)}")
+
+    def save_menu_item(self, item, download_mode='all', with_image=True):
+        """Save a menu item's details and image to its own folder.
+
+        Pass with_image=False to skip the image download, e.g. when images
+        are fetched concurrently by run().
+        """
+        folder_name = item['slug']
         
         # For flat mode, use output_dir directly
         if download_mode == 'flat':
@@ -238,14 +668,20 @@ class MenuGrabber:
         if download_mode not in ['images', 'flat']:
             details_filename = f"{folder_name}_details.txt"
             details_path = os.path.join(folder_path, details_filename)
-            with open(details_path, 'w', encoding='utf-8-sig') as f:
-                f.write(f"Başlık: {item['title']}\n\n")
-                if item['description']:
-                    f.write(f"Açıklama: {item['description']}\n")
+            # Pre-encode as UTF-8 with BOM and write it with a single syscall
+            content = f"Başlık: {item['title']}\n\n"
+            if item['description']:
+                content += f"Açıklama: {item['description']}\n"
+            data = ('\ufeff' + content).encode('utf-8')
+            fd = os.open(details_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
 
         # Download image if available and not in menu-only mode
-        if item['image_url'] and download_mode != 'menu':
-            image_filename = self.download_image(item['image_url'], folder_path, item['title'])
+        if with_image and item['image_url'] and download_mode != 'menu':
+            image_filename = self.download_image(item['image_url'], folder_path, item['slug'])
             if image_filename:
                 logger.info(f"Saved image as {image_filename}")
 
@@ -256,7 +692,9 @@ class MenuGrabber:
         try:
             # Fetch and parse the webpage
             html_content = self.fetch_page()
-            menu_items = self.parse_menu_items(html_content)
+            menu_items = self.parse_menu_items(html_content, self.page_encoding)
+            # Only the extracted items are needed during downloads
+            del html_content
 
             if not menu_items:
                 logger.warning("No menu items found on the page")
@@ -274,19 +712,54 @@ class MenuGrabber:
             }
             logger.info(f"Found {len(menu_items)} menu items. Starting download of {mode_desc[download_mode]}...")
             
+            downloads = []
             for item in menu_items:
-                folder_path = self.save_menu_item(item, download_mode)
+                folder_path = self.save_menu_item(item, download_mode, with_image=False)
                 if download_mode != 'flat':
                     logger.info(f"Saved menu item '{item['title']}' to {folder_path}")
                 else:
                     logger.info(f"Processed menu item '{item['title']}'")
 
+                # Queue image for concurrent download unless in menu-only mode
+                if item['image_url'] and download_mode != 'menu':
+                    downloads.append((item['image_url'], folder_path, item['slug']))
+
+            # Download each distinct image URL once, concurrently
+            if downloads:
+                # Later menu items sharing an image URL get a copy of the file
+                first_by_url = {}
+                copies = {}
+                for url, folder_path, slug in downloads:
+                    if url in first_by_url:
+                        copies.setdefault(url, []).append((folder_path, slug))
+                    else:
+                        first_by_url[url] = (url, folder_path, slug)
+                unique_downloads = list(first_by_url.values())
+                duplicates = len(downloads) - len(unique_downloads)
+                if duplicates:
+                    logger.info(f"Skipping {duplicates} duplicate image URLs")
+
+                filenames = asyncio.run(self._download_all(unique_downloads, copies))
+                for filename in filenames:
+                    if filename:
+                        logger.info(f"Saved image as {filename}")
+
             logger.info(f"Download complete for {mode_desc[download_mode]}!")
 
         except Exception as e:
             logger.error(f"An error occurred: {str(e)}")
             raise
 
+def positive_int(value):
+    """argparse type for options that need an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description='Download menu items from a webpage')
     parser.add_argument('--url', help='URL of the webpage to download menu items from')
@@ -294,6 +767,10 @@ def main():
     parser.add_argument('--mode', 
                        choices=['all', 'images', 'menu', 'flat'], 
                        help='Download mode: all (everything), images (only images), menu (only menu items without images), flat (all images in single directory)')
+    parser.add_argument('--workers', type=positive_int, default=TASKS_COUNT,
+                       help=f'Number of concurrent image downloads (default: {TASKS_COUNT})')
+    parser.add_argument('--parser', choices=['selectolax', 'bs4'],
+                       help='HTML parser to use (default: selectolax if installed, otherwise bs4)')
     
     args = parser.parse_args()
     url = args.url
@@ -329,7 +806,7 @@ def main():
                 print("Geçersiz seçim. Lütfen 1, 2, 3 veya 4 girin.")
 
     try:
-        grabber = MenuGrabber(url=url, output_dir=args.output)
+        grabber = MenuGrabber(url=url, output_dir=args.output, workers=args.workers, parser=args.parser)
         grabber.run(download_mode=mode)
             
     except Exception as e: